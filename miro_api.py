@@ -0,0 +1,209 @@
+"""
+Module: miro_api - Shared Miro API Helpers
+
+Description:
+This module centralizes the Miro API access used by the export and monitoring
+scripts: pooled session construction, cursor- and offset-based pagination, and
+fast JSON decoding. Keeping one implementation means connection reuse, retry
+policy, page sizing, and parser choices apply to every caller.
+
+Functions:
+- make_session: Builds a pooled, retrying requests.Session with auth headers.
+- iter_members: Yields organization members using cursor-based pagination.
+- iter_boards: Yields boards, fetching offset-addressed pages with a thread pool.
+- fetch_boards_async: Fetches boards concurrently with aiohttp (if installed).
+- fetch_boards: Fetches all boards using whichever concurrent path is available.
+
+Notes:
+- aiohttp and orjson are optional; the module falls back to requests-based
+  threading and stdlib JSON when they are not installed.
+- Members pagination uses opaque cursors, so those pages are fetched
+  sequentially; board pages are addressable by offset and fetched concurrently.
+
+Author: Chad Ramey
+Date: August 31, 2026
+"""
+
+import asyncio
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson  # Much faster JSON decoding on large pages, if installed.
+except ImportError:
+    orjson = None
+
+API_BASE = "https://api.miro.com/v2"
+
+# Board pages are capped at 50 by the API; member pages allow 100.
+BOARDS_PAGE_LIMIT = 50
+MEMBERS_PAGE_LIMIT = 100
+
+def _parse_json(response):
+    """Decode a requests response body, preferring orjson when installed."""
+    return orjson.loads(response.content) if orjson else response.json()
+
+def make_session(api_token):
+    """
+    Build a requests.Session for the Miro API.
+
+    The session carries the auth headers and mounts a pooled HTTPAdapter with
+    a retry policy for rate limits and transient server errors, so every page
+    request reuses one TLS connection.
+
+    Args:
+        api_token (str): Miro API token.
+
+    Returns:
+        requests.Session: Configured session; close it (or use as a context
+        manager) when done.
+    """
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {api_token}",
+        "Accept": "application/json",
+        # JSON pages compress very well; responses are decoded transparently.
+        "Accept-Encoding": "gzip, deflate"
+    })
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    ))
+    return session
+
+def iter_members(session, org_id, verbose=False):
+    """
+    Yield members of a Miro organization using cursor-based pagination.
+
+    Members are yielded page by page as they arrive, so callers can count,
+    filter, or write them without materializing the full list.
+
+    Args:
+        session (requests.Session): Session from make_session.
+        org_id (str): Miro Organization ID.
+        verbose (bool): Print a progress line per page when True.
+
+    Yields:
+        dict: A member with its details.
+    """
+    url = f"{API_BASE}/orgs/{org_id}/members"
+    cursor = None
+
+    while True:
+        params = {"limit": MEMBERS_PAGE_LIMIT}
+        if cursor:
+            params["cursor"] = cursor
+        response = session.get(url, params=params)
+        response.raise_for_status()
+
+        data = _parse_json(response)
+        yield from data.get("data", [])
+
+        cursor = data.get("cursor")
+        if not cursor:
+            break
+
+        if verbose:
+            print("Fetching next page...")
+
+def iter_boards(session, max_workers=10):
+    """
+    Yield all boards, fetching the offset-addressed pages concurrently.
+
+    The first request reveals the total number of boards; the remaining pages
+    are fetched by a thread pool over the shared session and yielded in order.
+
+    Args:
+        session (requests.Session): Session from make_session.
+        max_workers (int): Size of the thread pool.
+
+    Yields:
+        dict: A board with its details.
+    """
+    url = f"{API_BASE}/boards"
+    limit = BOARDS_PAGE_LIMIT
+
+    def fetch_page(offset):
+        response = session.get(url, params={"limit": limit, "offset": offset})
+        response.raise_for_status()
+        return _parse_json(response)
+
+    first_page = fetch_page(0)
+    data = first_page.get("data", [])
+    yield from data
+    total = first_page.get("total", len(data))
+
+    if total <= limit:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for page in executor.map(fetch_page, range(limit, total, limit)):
+            yield from page.get("data", [])
+
+async def fetch_boards_async(api_token):
+    """
+    Fetch all boards from Miro concurrently using aiohttp.
+
+    The first request reveals the total number of boards; the remaining
+    pages are addressed by offset and fetched with asyncio.gather, bounded
+    by a semaphore to respect Miro rate limits.
+
+    Args:
+        api_token (str): Miro API token.
+
+    Returns:
+        list: List of boards with their details.
+    """
+    url = f"{API_BASE}/boards"
+    headers = {
+        "Authorization": f"Bearer {api_token}",
+        "Accept": "application/json",
+        # JSON pages compress very well; responses are decoded transparently.
+        "Accept-Encoding": "gzip, deflate"
+    }
+    limit = BOARDS_PAGE_LIMIT
+    semaphore = asyncio.Semaphore(10)
+
+    async with aiohttp.ClientSession(headers=headers) as session:
+        async def fetch_page(offset):
+            async with semaphore:
+                async with session.get(url, params={"limit": limit, "offset": offset}) as response:
+                    response.raise_for_status()
+                    if orjson:
+                        return orjson.loads(await response.read())
+                    return await response.json()
+
+        first_page = await fetch_page(0)
+        boards = first_page.get("data", [])
+        total = first_page.get("total", len(boards))
+
+        pages = await asyncio.gather(*(fetch_page(offset) for offset in range(limit, total, limit)))
+        for page in pages:
+            boards.extend(page.get("data", []))
+
+    return boards
+
+def fetch_boards(api_token):
+    """
+    Fetch all boards from Miro using the API.
+
+    Uses the aiohttp path when available, otherwise the thread-pool one.
+
+    Args:
+        api_token (str): Miro API token.
+
+    Returns:
+        list: List of boards with their details.
+    """
+    if aiohttp is not None:
+        return asyncio.run(fetch_boards_async(api_token))
+    with make_session(api_token) as session:
+        return list(iter_boards(session))
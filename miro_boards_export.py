@@ -6,9 +6,11 @@ This script exports the list of boards from Miro to a CSV file.
 The exported CSV file includes details such as Board ID, Name, Owner, Created At, Modified At, and Link.
 
 Functions:
-- fetch_boards: Fetches boards from the Miro account using the API with pagination support.
 - export_to_csv: Exports the fetched board data to a CSV file.
 
+Board fetching lives in miro_api, which handles sessions, concurrency,
+and pagination for all the scripts in this repository.
+
 Usage:
 1. Run the script.
 2. Enter the path to the text file containing the Miro API token when prompted.
@@ -23,47 +25,10 @@ Author: Chad Ramey
 Date: December 19, 2024
 """
 
-import requests
 import csv
 import os
 
-def fetch_boards(api_token):
-    """
-    Fetch all boards from Miro using the API.
-
-    :param api_token: Miro API token with necessary permissions.
-    :return: List of boards with their details.
-    """
-    url = "https://api.miro.com/v2/boards"
-    headers = {
-        "Authorization": f"Bearer {api_token}"
-    }
-    boards = []
-    params = {
-        "limit": 50  # Adjusted to comply with API restrictions
-    }
-
-    while url:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code != 200:
-            print(f"Error: {response.status_code}, {response.text}")
-            break
-
-        try:
-            data = response.json()
-        except ValueError:
-            print("Error: Failed to parse JSON response.")
-            break
-
-        boards.extend(data.get("data", []))
-
-        next_link = data.get("links", {}).get("next")
-        if next_link:
-            url = next_link
-        else:
-            break
-
-    return boards
+from miro_api import fetch_boards
 
 def export_to_csv(boards, output_file):
     """
@@ -72,16 +37,18 @@ def export_to_csv(boards, output_file):
     :param boards: List of boards.
     :param output_file: Path to the output CSV file.
     """
-    with open(output_file, mode="w", newline="", encoding="utf-8") as file:
+    # 1 MiB buffer keeps large exports from issuing a write() syscall per few rows.
+    with open(output_file, mode="w", newline="", encoding="utf-8", buffering=1024 * 1024) as file:
         writer = csv.writer(file)
         # Writing header
         writer.writerow(["Board ID", "Name", "Owner", "Created At", "Modified At", "Link"])
 
         for board in boards:
+            owner = board.get("owner")
             writer.writerow([
                 board.get("id"),
                 board.get("name"),
-                board.get("owner", {}).get("name"),
+                owner.get("name") if owner else None,
                 board.get("createdAt"),
                 board.get("modifiedAt"),
                 board.get("viewLink")
@@ -110,7 +77,11 @@ def main():
         return
 
     print("Fetching boards from Miro...")
-    boards = fetch_boards(api_token)
+    try:
+        boards = fetch_boards(api_token)
+    except Exception as e:
+        print(f"Error: Unable to fetch boards ({e}). Exiting...")
+        return
 
     if not boards:
         print("No boards found or an error occurred.")
@@ -7,10 +7,12 @@ It filters active users with a "full" license and compares the count against a p
 Alerts are sent to a Slack channel if license usage exceeds the total allocated.
 
 Functions:
-- fetch_members: Fetches Miro organization members with pagination.
 - post_to_slack: Sends a message to a Slack channel via webhook.
 - main: Main function to calculate license usage and send alerts.
 
+Member fetching lives in miro_api, which handles sessions, pagination,
+and JSON decoding for all the scripts in this repository.
+
 Usage:
 1. Set the following environment variables:
    - `MIRO_API_TOKEN`: Miro API token with org member access.
@@ -29,42 +31,28 @@ Date: December 11, 2024
 import os
 import requests
 
-def fetch_members(api_token, org_id):
-    """
-    Fetch members from the Miro organization using API pagination.
-    Args:
-        api_token (str): Miro API token.
-        org_id (str): Miro Organization ID.
-    Returns:
-        list: List of member dictionaries.
-    """
-    url = f"https://api.miro.com/v2/orgs/{org_id}/members"
-    headers = {
-        "Authorization": f"Bearer {api_token}",
-        "Accept": "application/json"
-    }
-
-    members = []
-    cursor = None
-
-    while True:
-        params = {"cursor": cursor} if cursor else {}
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-
-        data = response.json()
-        members.extend(data.get("data", []))
-        cursor = data.get("cursor")
-
-        if not cursor:
-            break
-
-    return members
+from requests.adapters import HTTPAdapter, Retry
+
+from miro_api import iter_members, make_session
+
+# Shared session for Slack posts so retries and follow-up messages reuse the
+# same TLS connection. Webhook POSTs are idempotent, so retrying them is safe.
+_slack_session = requests.Session()
+_slack_session.mount("https://", HTTPAdapter(
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST"]
+    )
+))
 
 def post_to_slack(webhook_url, message):
     """Send a message to Slack via webhook."""
     payload = {"text": message}
-    response = requests.post(webhook_url, json=payload)
+    # Explicit (connect, read) timeout so a hung webhook cannot stall a runner.
+    response = _slack_session.post(webhook_url, json=payload, timeout=(3.05, 10))
     response.raise_for_status()
 
 def main():
@@ -78,12 +66,13 @@ def main():
     if not api_token or not org_id or not slack_webhook_url:
         raise ValueError("Environment variables MIRO_API_TOKEN, MIRO_ORG_ID, and SLACK_WEBHOOK_URL are required.")
 
-    # Fetch all organization members
-    members = fetch_members(api_token, org_id)
-
-    # Filter licensed users: active = true and license = "full"
-    licensed_users = [member for member in members if member.get("active") and member.get("license") == "full"]
-    used_licenses = len(licensed_users)
+    # Count licensed users (active = true and license = "full") in a single
+    # pass while pagination streams, without materializing the member list.
+    with make_session(api_token) as session:
+        used_licenses = sum(
+            1 for member in iter_members(session, org_id)
+            if member.get("active") and member.get("license") == "full"
+        )
     available_licenses = total_licenses - used_licenses
 
     # Generate Slack message